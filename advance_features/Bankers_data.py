@@ -1,18 +1,19 @@
-resource_names = ["R1", "R2", "R3"]
-total_resources = [10, 5, 7]
+# Sample data is kept in tuples so it is read-only and can be shared between runs without copying
+resource_names = ("R1", "R2", "R3")
+total_resources = (10, 5, 7)
 
-process_ids = ["P0", "P1", "P2", "P3", "P4"]
-allocation = [
-    [0, 1, 0],  # P0
-    [2, 0, 0],  # P1
-    [3, 0, 2],  # P2
-    [2, 1, 1],  # P3
-    [0, 0, 2]   # P4
-]
-max_need = [
-    [7, 5, 3],  # P0
-    [3, 2, 2],  # P1
-    [9, 0, 2],  # P2
-    [2, 2, 2],  # P3
-    [4, 3, 3]   # P4
-]
+process_ids = ("P0", "P1", "P2", "P3", "P4")
+allocation = (
+    (0, 1, 0),  # P0
+    (2, 0, 0),  # P1
+    (3, 0, 2),  # P2
+    (2, 1, 1),  # P3
+    (0, 0, 2)   # P4
+)
+max_need = (
+    (7, 5, 3),  # P0
+    (3, 2, 2),  # P1
+    (9, 0, 2),  # P2
+    (2, 2, 2),  # P3
+    (4, 3, 3)   # P4
+)
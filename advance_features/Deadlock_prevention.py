@@ -1,78 +1,238 @@
+import heapq
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+from operator import sub
 from .Bankers_data import total_resources, allocation, max_need, process_ids, resource_names
-def Bankers_algorithm(total_resources, allocation, max_need, process_ids, resource_names):
+
+
+def _need_and_available(total_resources, allocation, max_need):
     """
-    Implements Banker's Algorithm for deadlock prevention.
+    Computes the Need matrix and the initially Available vector.
     """
+    num_resources = len(total_resources)
+    # Calculate Available = Total - Σ Allocation (column sums taken in one pass with zip)
+    allocated_sum = [sum(column) for column in zip(*allocation)] or [0] * num_resources
+    available = list(map(sub, total_resources, allocated_sum))
 
-    num_resources = len(resource_names)
-    # Calculate Available = Total - Σ Allocation
-    allocated_sum = [sum(x[i] for x in allocation) for i in range(num_resources)]
-    available = [total_resources[i] - allocated_sum[i] for i in range(num_resources)]
+    # Calculate Need = Max - Allocation, row by row
+    need = [list(map(sub, max_row, alloc_row)) for max_row, alloc_row in zip(max_need, allocation)]
+    return need, available
+
+
+def _pack(row, lane_bits):
+    """
+    Packs a resource vector into one int, lane_bits bits per resource (resource 0 in the lowest lane).
+    """
+    packed = 0
+    for r, value in enumerate(row):
+        packed |= value << (lane_bits * r)
+    return packed
 
-    # Calculate Need = Max - Allocation
-    need = [
-        [max_need[i][j] - allocation[i][j] for j in range(num_resources)]
-        for i in range(len(allocation))
-    ]
 
-    finished = [False] * len(process_ids)
-    safe_sequence = []
+def _blocking_resource(need_packed, available_packed, guards, lane_bits):
+    """
+    Returns the index of the first resource whose Need exceeds Available, or None.
+    """
+    # A lane borrows (and loses its guard bit) exactly when Need > Available for that resource
+    blocked = guards & ~((available_packed | guards) - need_packed)
+    if not blocked:
+        return None
+    return ((blocked & -blocked).bit_length() - 1) // lane_bits
+
+
+def _bankers_safe(total_resources, allocation, max_need):
+    """
+    Pure safety check of Banker's Algorithm (no printing).
+    Returns (safe_sequence, is_safe) where safe_sequence holds process indices
+    in the order they can finish; it is partial when the state is unsafe.
+    """
+    need, available = _need_and_available(total_resources, allocation, max_need)
+    num_resources = len(available)
+    num_processes = len(allocation)
+
+    if any(value < 0 for row in allocation for value in row):
+        raise ValueError("Allocation must be >= 0.")
+    if any(value < 0 for row in need for value in row):
+        raise ValueError("Allocation must not exceed Max Need.")
+    # Allocations above Total leave nothing to hand out: the state is unsafe (and could not be packed)
+    if any(value < 0 for value in available):
+        return [], False
+
+    # Need <= Available is tested for all resources at once (SWAR): each vector is packed into
+    # one int with a spare guard bit on top of every lane, wide enough for any value that can occur.
+    lane_bits = max([1, *total_resources, *(value for row in need for value in row)]).bit_length() + 1
+    guards = _pack([1 << (lane_bits - 1)] * num_resources, lane_bits)
+    need_packed = [_pack(row, lane_bits) for row in need]
+    allocation_packed = [_pack(row, lane_bits) for row in allocation]
+    available_packed = _pack(available, lane_bits)
+
+    # Every waiting process is parked under one resource it is blocked on, so a
+    # release only re-checks the processes waiting on resources that just grew.
+    blocked_by = [[] for _ in range(num_resources)]
+    # Ready processes keyed by (cycle, index): the order a repeated top-to-bottom scan would pick them
+    ready = []
+    for i in range(num_processes):
+        r = _blocking_resource(need_packed[i], available_packed, guards, lane_bits)
+        if r is None:
+            ready.append((0, i))
+        else:
+            blocked_by[r].append(i)
+
+    # Preallocated safe sequence; num_finished is its write pointer
+    safe_sequence = [0] * num_processes
+    num_finished = 0
+
+    while ready:
+        cycle, i = heapq.heappop(ready)
+        # Release resources (lanes never carry into each other: Available never exceeds Total)
+        available_packed += allocation_packed[i]
+        safe_sequence[num_finished] = i
+        num_finished += 1
+
+        for r, released in enumerate(allocation[i]):
+            if released <= 0 or not blocked_by[r]:
+                continue
+            waiting, blocked_by[r] = blocked_by[r], []
+            for j in waiting:
+                blocker = _blocking_resource(need_packed[j], available_packed, guards, lane_bits)
+                if blocker is None:
+                    # A scan would still reach j in this cycle only if it comes after i
+                    heapq.heappush(ready, (cycle if j > i else cycle + 1, j))
+                else:
+                    blocked_by[blocker].append(j)
+
+    if num_finished < num_processes:
+        return safe_sequence[:num_finished], False
+    return safe_sequence, True
+
+
+def _is_safe(total_resources, allocation, max_need):
+    """
+    Returns True if the given state is safe (module level so worker processes can run it).
+    """
+    return _bankers_safe(total_resources, allocation, max_need)[1]
+
+
+def batch_safety(total_resources, allocation_scenarios, max_need, workers=None):
+    """
+    Checks many candidate allocations against the same totals and maximum claims,
+    e.g. every "can this request be granted?" scenario at once.
+    Returns a list with one bool per scenario (True if it is safe).
+    A scenario that grants more than Total Resources counts as unsafe, e.g. with the sample data
+    batch_safety(total_resources, [allocation, ((4, 1, 0), *allocation[1:])], max_need) -> [True, False];
+    one that grants a process more than its Max Need is invalid and raises ValueError.
+    The checks are independent, so with workers > 1 they are spread over that many processes.
+    """
+    if not workers or workers <= 1:
+        return [_is_safe(total_resources, scenario, max_need) for scenario in allocation_scenarios]
 
-    print("\n===================== DEADLOCK PREVENTION: BANKER'S ALGORITHM =====================\n")
+    chunksize = max(1, len(allocation_scenarios) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_is_safe, repeat(total_resources), allocation_scenarios, repeat(max_need), chunksize=chunksize))
 
-    print("Total Resources:")
-    for i in range(num_resources):
-        print(f"{resource_names[i]} = {total_resources[i]}", end="  ")
-    print("\n")
+
+def _format_row(row):
+    """
+    Formats a resource vector as "[a, b, c]".
+    """
+    return "[" + ", ".join(map(str, row)) + "]"
+
+
+@lru_cache(maxsize=32)
+def _cached_safe_order(total_resources, allocation, max_need):
+    """
+    Memoized _bankers_safe for hashable (tuple) inputs; the order is returned as a tuple so it can be shared.
+    """
+    safe_order, is_safe = _bankers_safe(total_resources, allocation, max_need)
+    return tuple(safe_order), is_safe
+
+
+def _compute_safe_sequence(total_resources, allocation, max_need, process_ids):
+    """
+    Runs Banker's Algorithm without any I/O.
+    Returns (safe_sequence, trace): safe_sequence is the list of PIDs (None if the state is unsafe)
+    and trace holds a (pid, released_allocation, new_available) tuple for every process that finished.
+    """
+    _, available = _need_and_available(total_resources, allocation, max_need)
+    # Repeated runs on an unchanged state (e.g. "Run Again") reuse the cached result
+    safe_order, is_safe = _cached_safe_order(
+        tuple(total_resources), tuple(map(tuple, allocation)), tuple(map(tuple, max_need))
+    )
+
+    trace = []
+    for i in safe_order:
+        # Release resources in place (no new list per release)
+        released = allocation[i]
+        for r in range(len(available)):
+            available[r] += released[r]
+        trace.append((process_ids[i], released, tuple(available)))
+
+    safe_sequence = [process_ids[i] for i in safe_order] if is_safe else None
+    return safe_sequence, trace
+
+
+def print_bankers_report(trace, safe_sequence, total_resources, allocation, max_need, process_ids, resource_names, out=print):
+    """
+    Prints the step-by-step Banker's Algorithm report for a computed trace.
+    The report is handed to out (default: print) as a single string, so a GUI can insert it in one call.
+    """
+    num_resources = len(resource_names)
+    need, available = _need_and_available(total_resources, allocation, max_need)
+
+    # The whole report is collected here and passed to out once at the end
+    lines = ["", "===================== DEADLOCK PREVENTION: BANKER'S ALGORITHM =====================", ""]
+
+    lines.append("Total Resources:")
+    lines.append("".join(f"{resource_names[i]} = {total_resources[i]}  " for i in range(num_resources)))
+    lines.append("")
 
     # Process Details Table
-    print("PROCESS DETAILS:")
+    lines.append("PROCESS DETAILS:")
     header_alloc = "Allocation(" + ",".join(resource_names) + ")"
     header_max = "Max Need(" + ",".join(resource_names) + ")"
     header_need = "Remaining Need"
-    print(f"{'PID':<8} {header_alloc:<25} {header_max:<25} {header_need:<20} Status")
-    print("-"*90)
+    lines.append(f"{'PID':<8} {header_alloc:<25} {header_max:<25} {header_need:<20} Status")
+    lines.append("-"*90)
     for i, pid in enumerate(process_ids):
-        print(f"{pid:<8} {str(allocation[i]):<25} {str(max_need[i]):<25} {str(need[i]):<20} Pending")
-    print()
+        lines.append(f"{pid:<8} {_format_row(allocation[i]):<25} {_format_row(max_need[i]):<25} {_format_row(need[i]):<20} Pending")
+    lines.append("")
 
     # Available Resources
-    print("AVAILABLE RESOURCES:")
-    for i in range(num_resources):
-        print(f"{resource_names[i]} = {available[i]}", end="  ")
-    print("\n" + "-"*90)
-
-    # --- Banker's Algorithm Logic ---
-    while len(safe_sequence) < len(process_ids):
-
-        executed_in_cycle = False
-
-        for i in range(len(process_ids)):
-            if not finished[i]:
-                # Check if Need <= Available
-                if all(need[i][r] <= available[r] for r in range(num_resources)):
-                    print(f"Process {process_ids[i]} can finish. Releasing resources: {allocation[i]}")
-                    # Release resources
-                    available = [available[r] + allocation[i][r] for r in range(num_resources)]
-                    finished[i] = True
-                    safe_sequence.append(process_ids[i])
-                    executed_in_cycle = True
-
-                    print("New Available: ", end="")
-                    print(", ".join([f"{resource_names[r]}={available[r]}" for r in range(num_resources)]), "\n")
-        
-        if not executed_in_cycle:
-            print("SYSTEM STATE: UNSAFE — No safe sequence exists.\n")
-            return None
-
-    # Final Output
-    print("-"*90)
-    print("SAFE SEQUENCE FOUND:")
-    print(" → ".join(safe_sequence))
-    print("\nSYSTEM STATE: SAFE")
-    print("="*90 + "\n")
-
-    return safe_sequence
+    lines.append("AVAILABLE RESOURCES:")
+    lines.append("".join(f"{resource_names[i]} = {available[i]}  " for i in range(num_resources)))
+    lines.append("-"*90)
+
+    # Release steps
+    for pid, released, new_available in trace:
+        lines.append(f"Process {pid} can finish. Releasing resources: {_format_row(released)}")
+        lines.append("New Available: " + ", ".join([f"{resource_names[r]}={new_available[r]}" for r in range(num_resources)]) + " ")
+        lines.append("")
+
+    if safe_sequence is None:
+        lines.append("SYSTEM STATE: UNSAFE — No safe sequence exists.")
+        lines.append("")
+    else:
+        # Final Output
+        lines.append("-"*90)
+        lines.append("SAFE SEQUENCE FOUND:")
+        lines.append(" → ".join(safe_sequence))
+        lines.append("")
+        lines.append("SYSTEM STATE: SAFE")
+        lines.append("="*90)
+        lines.append("")
+
+    out("\n".join(lines))
+
+
+def Bankers_algorithm(total_resources, allocation, max_need, process_ids, resource_names, out=print):
+    """
+    Implements Banker's Algorithm for deadlock prevention.
+    Prints the report through out and returns (safe_sequence, trace), see _compute_safe_sequence.
+    """
+    safe_sequence, trace = _compute_safe_sequence(total_resources, allocation, max_need, process_ids)
+    print_bankers_report(trace, safe_sequence, total_resources, allocation, max_need, process_ids, resource_names, out)
+    return safe_sequence, trace
 
 
 if __name__ == "__main__":
@@ -4,8 +4,8 @@ Bonus: Deadlock Prevention Package
 Contains deadlock prevention algorithms like Banker's Algorithm.
 """
 
-from .Deadlock_prevention import bankers_algorithm
+from .Deadlock_prevention import Bankers_algorithm as bankers_algorithm, print_bankers_report, batch_safety
 from .Bankers_data import total_resources, allocation, max_need, process_ids, resource_names
 
 
-__all__ = ["bankers_algorithm"]
+__all__ = ["bankers_algorithm", "print_bankers_report", "batch_safety"]
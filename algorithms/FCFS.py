@@ -18,17 +18,20 @@ def fcfs(processes: List[Dict]) -> Tuple[List[Dict], List[Tuple[str, int, int]]]
         if p["arrival"] < 0 or p["burst"] <= 0:#this checks that arrival is not negative and burst is not negative also not equal to 0
             raise ValueError("Arrival must be >= 0 and Burst Time must be > 0.")
 
-    # FCFS main logic sorting the processes according to its arrival time
-    # using lambda function as a key for sorted funtion, it gets arrival from every dictionary and helps in sorting
-    processes = sorted(processes, key=lambda x: x["arrival"])
+    # FCFS main logic: arrival and burst columns are read out of the dicts once,
+    # then process indices are sorted by arrival time (stable, so ties keep input order)
+    arrivals = [p["arrival"] for p in processes]
+    bursts = [p["burst"] for p in processes]
+    order = sorted(range(len(processes)), key=arrivals.__getitem__)
 
     current_time = 0
     gantt_chart = []
+    ordered = []
 
     # Main FCFS loop
-    for proc in processes:
-        arrival = proc["arrival"]
-        burst = proc["burst"]
+    for i in order:
+        arrival = arrivals[i]
+        burst = bursts[i]
 
         # This checks if the CPU is free before the process arrives.
         # If the current time is before the arrival time, we will wait until the process shows up.
@@ -37,23 +40,29 @@ def fcfs(processes: List[Dict]) -> Tuple[List[Dict], List[Tuple[str, int, int]]]
             current_time = arrival
 
         # Recording start time
-        proc["start"] = current_time
+        start = current_time
 
         # Executing process fully (non-preemptive)
         current_time += burst
 
         # Recording finish time
-        proc["finish"] = current_time
-
-        # Metrics Calculations
-        proc["turnaround"] = proc["finish"] - proc["arrival"] #total time taken from arrival to completion
-        proc["waiting"] = proc["turnaround"] - proc["burst"] #time process spent in ready queue
-        proc["response"] = proc["start"] - proc["arrival"] #time when process first gets the cpu 
+        finish = current_time
+
+        # Metrics Calculations, written back to the process dict in one update
+        proc = processes[i]
+        proc.update(
+            start=start,
+            finish=finish,
+            turnaround=finish - arrival, #total time taken from arrival to completion
+            waiting=finish - arrival - burst, #time process spent in ready queue
+            response=start - arrival, #time when process first gets the cpu 
+        )
+        ordered.append(proc)
 
         # Append to Gantt chart
-        gantt_chart.append((proc["pid"], proc["start"], proc["finish"]))
+        gantt_chart.append((proc["pid"], start, finish))
 
-    return processes, gantt_chart
+    return ordered, gantt_chart
 
 
 
@@ -95,12 +104,9 @@ if __name__ == "__main__":
         print(f"Execution Order: {execution_order}\n")
         
         # Gantt Chart Timeline
-        timeline = "|"
-        labels = "0"
-        for pid, start, end in chart:
-            duration = end - start
-            timeline += f" {pid:^8} |"
-            labels += f"{start:>10}{end:>10}"
+        # (fragments are joined once instead of growing the strings with += per segment)
+        timeline = "|" + "".join([f" {pid:^8} |" for pid, _, _ in chart])
+        labels = "0" + "".join([f"{start:>10}{end:>10}" for _, start, end in chart])
         
         print("Gantt Chart:")
         print(timeline)
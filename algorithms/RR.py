@@ -1,6 +1,6 @@
 from typing import List, Dict, Tuple
 from collections import deque
-import copy
+from operator import itemgetter
 
 def round_robin(processes: List[Dict], quantum: int) -> Tuple[List[Dict], List[Tuple[str, int, int]]]:
     #Input Validations
@@ -26,76 +26,82 @@ def round_robin(processes: List[Dict], quantum: int) -> Tuple[List[Dict], List[T
             raise ValueError("Priority must be >= 0.")
 
     # Preparing Data for processing
-    processes = copy.deepcopy(processes)
+    processes = [dict(p) for p in processes]  # shallow copy of each flat dict, so the input is left untouched
     gantt_chart = []
     current_time = 0
 
-    for p in processes:
-        p["remaining"] = p["burst"]
-        p["start"] = None
-        p["finish"] = None
-        p["response"] = None
+    # Sort by arrival time (stable; itemgetter extracts the key in C, no Python call per process)
+    processes.sort(key=itemgetter("arrival"))
 
-    # Sort by arrival time
-    processes.sort(key=lambda x: x["arrival"])
+    # Columns are read out of the sorted dicts once; the loop below only works on these lists
+    # and the ready queue holds process indices into them
+    num_processes = len(processes)
+    pids = [p["pid"] for p in processes]
+    arrivals = [p["arrival"] for p in processes]
+    remaining = [p["burst"] for p in processes]
+    starts = [None] * num_processes
 
     ready_queue = deque()
-    remaining_processes = processes.copy()
     completed = []
+    # Processes are sorted by arrival, so everything before next_arrival_idx has already been queued
+    next_arrival_idx = 0
 
     # Round Ribin Mamin Loop
-    while remaining_processes:
+    while len(completed) < num_processes:
 
         # Add newly arrived processes
-        for p in remaining_processes:
-            if p["arrival"] <= current_time and p not in ready_queue:#checks if arrival time of process is smaller than current time and also process not in ready queue then add it to ready queue
-                ready_queue.append(p)
+        while next_arrival_idx < num_processes and arrivals[next_arrival_idx] <= current_time:
+            ready_queue.append(next_arrival_idx)
+            next_arrival_idx += 1
 
-        #if there is no process in ready queue move to the next process with minimum arrival time and add it to the ready_queue
+        #if there is no process in ready queue, CPU stays idle until the next process arrives
         if not ready_queue:
-            next_proc = min(remaining_processes, key=lambda x: x["arrival"])
-            current_time = next_proc["arrival"]
-            ready_queue.append(next_proc)
+            current_time = arrivals[next_arrival_idx]
+            continue
 
         # Take first ready process from ready queue
-        proc = ready_queue.popleft()
+        i = ready_queue.popleft()
         q = quantum  # quantum time
 
-        # Response time, first time a proess getting CPU
-        if proc["start"] is None:
-            proc["start"] = current_time
-            proc["response"] = proc["start"] - proc["arrival"]
+        # Start time is recorded the first time a proess gets the CPU (used for response time)
+        if starts[i] is None:
+            starts[i] = current_time
 
 
         # This line determines how much CPU time to allocate to the current process in this round.
         # It assigns to exec_time the smaller value between the process's quantum (q) and its remaining burst time.
         # This ensures that the process is either run for the full quantum, or—if it has less CPU time left than that—only until it finishes.
-        exec_time = min(q, proc["remaining"])
+        exec_time = min(q, remaining[i])
         # Set when this burst starts and ends
         start_t = current_time
         end_t = current_time + exec_time
         current_time += exec_time #the clock is updated to show how much total CPU time has passed after executing this part.
-        proc["remaining"] -= exec_time  # Decrease time left for this process
+        remaining[i] -= exec_time  # Decrease time left for this process
 
         # Add Entries in gannt chart
-        gantt_chart.append((proc["pid"], start_t, end_t))
-
-        # If process is finished
-        if proc["remaining"] == 0:
-            proc["finish"] = current_time
-            proc["turnaround"] = proc["finish"] - proc["arrival"]
-            proc["waiting"] = proc["turnaround"] - proc["burst"]
+        gantt_chart.append((pids[i], start_t, end_t))
+
+        # if there is new arrival during this burst add it into the ready queue (ahead of the preempted process)
+        while next_arrival_idx < num_processes and arrivals[next_arrival_idx] <= end_t:
+            ready_queue.append(next_arrival_idx)
+            next_arrival_idx += 1
+
+        # If process is finished, its metrics are written back to the process dict
+        if remaining[i] == 0:
+            proc = processes[i]
+            proc.update(
+                remaining=0,
+                start=starts[i],
+                finish=current_time,
+                response=starts[i] - arrivals[i],
+                turnaround=current_time - arrivals[i],
+                waiting=current_time - arrivals[i] - proc["burst"],
+            )
             completed.append(proc)#adding completed process into the complete lists
-            remaining_processes.remove(proc)#removing the finished process from the remaining_processes
 
         else:
-            # if there is new arrival so add it into the ready queue
-            for p in remaining_processes:
-                if p["arrival"] > start_t and p["arrival"] <= end_t and p not in ready_queue:
-                    ready_queue.append(p)
-
             # Add back to end of queue
-            ready_queue.append(proc)#process having burst time so it will added to the end of queue for again chance of 
+            ready_queue.append(i)#process having burst time so it will added to the end of queue for again chance of 
 
     return completed, gantt_chart
 
@@ -132,11 +138,8 @@ if __name__ == "__main__":
     exec_order = " → ".join([pid for pid, _, _ in chart])
     print(f"Execution Order: {exec_order}\n")
 
-    timeline = "|"
-    times = "0"
-    for pid, s, e in chart:
-        timeline += f" {pid:^8} |"
-        times += f"{'':>8}{e:>3}"
+    timeline = "|" + "".join([f" {pid:^8} |" for pid, _, _ in chart])
+    times = "0" + "".join([f"{'':>8}{e:>3}" for _, _, e in chart])
     print(timeline)
     print(times)
 
@@ -1,5 +1,5 @@
 from typing import List, Dict, Tuple
-import copy
+import heapq
 
 def sjf(processes: List[Dict]) -> Tuple[List[Dict], List[Tuple[str, int, int]]]:
     # Input Validations
@@ -18,42 +18,54 @@ def sjf(processes: List[Dict]) -> Tuple[List[Dict], List[Tuple[str, int, int]]]:
             raise ValueError("Arrival must be >= 0 and Burst Time must be > 0.")
 
     # Preparing  Data
-    processes = copy.deepcopy(processes)  # Avoid modifying original input
+    processes = [dict(p) for p in processes]  # Avoid modifying original input (values are flat ints/strs, so per-dict copies suffice)
     completed = []
     gantt_chart = []
     current_time = 0
-    # Make a shallow copy of the process list to keep track of processes that are not finished yet
-    remaining_processes = processes.copy()
+    # Arrival and burst columns are read out of the dicts once; the loop below works on them
+    arrivals = [p["arrival"] for p in processes]
+    bursts = [p["burst"] for p in processes]
+    # Process indices ordered by arrival; next_idx points at the first one that has not arrived yet
+    arrival_order = sorted(range(len(processes)), key=arrivals.__getitem__)
+    next_idx = 0
+    # Min-heap of arrived processes keyed by burst time, input position breaks ties
+    ready = []
 
     # Main SJF Loop
-    while remaining_processes:
-        # Selecting processes that has arrived
-        available = [p for p in remaining_processes if p["arrival"] <= current_time]#using list comprehension
-
-        if not available:
+    while next_idx < len(arrival_order) or ready:
+        # Moving every process that has arrived into the ready heap
+        while next_idx < len(arrival_order) and arrivals[arrival_order[next_idx]] <= current_time:
+            i = arrival_order[next_idx]
+            heapq.heappush(ready, (bursts[i], i))
+            next_idx += 1
+
+        if not ready:
             # CPU is free until next process arrives
-            next_proc = min(remaining_processes, key=lambda x: x["arrival"])#if no processes available, cpu will find process with small arrival by default
-            current_time = next_proc["arrival"]
-            available = [next_proc]
+            current_time = arrivals[arrival_order[next_idx]]
+            continue
 
         # picking process with shortest burst time
-        proc = min(available, key=lambda x: x["burst"])
+        burst, i = heapq.heappop(ready)
+        arrival = arrivals[i]
 
         # Recording start and finish times
-        proc["start"] = current_time
-        current_time += proc["burst"]
-        proc["finish"] = current_time
+        start = current_time
+        current_time += burst
+        finish = current_time
 
         # Metrics 
-        proc["turnaround"] = proc["finish"] - proc["arrival"]
-        proc["waiting"] = proc["turnaround"] - proc["burst"]
-        proc["response"] = proc["start"] - proc["arrival"]
+        proc = processes[i]
+        proc.update(
+            start=start,
+            finish=finish,
+            turnaround=finish - arrival,
+            waiting=finish - arrival - burst,
+            response=start - arrival,
+        )
 
         # Updating lists
         completed.append(proc)
-        gantt_chart.append((proc["pid"], proc["start"], proc["finish"]))
-        # Removes the completed process from the list of processes, which are still waiting to be scheduled
-        remaining_processes.remove(proc)
+        gantt_chart.append((proc["pid"], start, finish))
 
     return completed, gantt_chart
 
@@ -84,11 +96,8 @@ if __name__ == "__main__":
     print("\nGANTT CHART:")
     execution_order = " → ".join([pid for pid, _, _ in chart])
     print(f"Execution Order: {execution_order}\n")
-    timeline = "|"
-    time_labels = "0"
-    for pid, start, end in chart:
-        timeline += f" {pid:^8} |"
-        time_labels += f"{'':>8}{end:>3}"
+    timeline = "|" + "".join([f" {pid:^8} |" for pid, _, _ in chart])
+    time_labels = "0" + "".join([f"{'':>8}{end:>3}" for _, _, end in chart])
     print(timeline)
     print(time_labels)
 
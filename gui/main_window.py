@@ -9,46 +9,81 @@ from tkinter import ttk, font
 from .scheduler_ui import SchedulerUI, DeadlockUI
 
 
+# Theme colors
+BG_MAIN = "#1e1e2e"
+FG_TITLE = "#cdd6f4"
+FG_SUBTITLE = "#bac2de"
+FG_FOOTER = "#6c7086"
+COLOR_FCFS = "#89b4fa"
+COLOR_SJF = "#a6e3a1"
+COLOR_RR = "#f9e2af"
+COLOR_DL = "#f38ba8"
+
+# Named fonts shared by every (re)build of the menu. They are created on first use
+# because a Tk root has to exist before a font.Font can be made.
+FONTS = {}
+
+
+def get_fonts():
+    """Return the shared named fonts, creating them once."""
+    if not FONTS:
+        FONTS.update(
+            title=font.Font(family="Arial", size=32, weight="bold"),
+            subtitle=font.Font(family="Arial", size=14),
+            button=font.Font(family="Arial", size=16, weight="bold"),
+            footer=font.Font(family="Arial", size=10),
+        )
+    return FONTS
+
+
 class MainWindow:
     """Main menu window with algorithm selection buttons."""
     
+    # Hover color for each button color (looked up on every <Enter> event)
+    HOVER_COLORS = {
+        COLOR_FCFS: "#a5c9ff",
+        COLOR_SJF: "#b8f0b3",
+        COLOR_RR: "#ffebc4",
+        COLOR_DL: "#ffa0bc"
+    }
+    
     def __init__(self, root):
         self.root = root
         self.root.title("CPU Scheduling Simulator")
         self.root.geometry("900x700")
-        self.root.configure(bg="#1e1e2e")
+        self.root.configure(bg=BG_MAIN)
         
         # Configure style
         self.setup_styles()
         
         # Main container
-        self.main_frame = tk.Frame(self.root, bg="#1e1e2e")
+        self.main_frame = tk.Frame(self.root, bg=BG_MAIN)
         self.main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
         
+        fonts = get_fonts()
+
         # Title
-        title_font = font.Font(family="Arial", size=32, weight="bold")
         title_label = tk.Label(
             self.main_frame,
             text="CPU Scheduling Simulator",
-            font=title_font,
-            bg="#1e1e2e",
-            fg="#cdd6f4"
+            font=fonts["title"],
+            bg=BG_MAIN,
+            fg=FG_TITLE
         )
         title_label.pack(pady=(20, 40))
         
         # Subtitle
-        subtitle_font = font.Font(family="Arial", size=14)
         subtitle_label = tk.Label(
             self.main_frame,
             text="Select an algorithm to simulate",
-            font=subtitle_font,
-            bg="#1e1e2e",
-            fg="#bac2de"
+            font=fonts["subtitle"],
+            bg=BG_MAIN,
+            fg=FG_SUBTITLE
         )
         subtitle_label.pack(pady=(0, 50))
         
         # Buttons container
-        buttons_frame = tk.Frame(self.main_frame, bg="#1e1e2e")
+        buttons_frame = tk.Frame(self.main_frame, bg=BG_MAIN)
         buttons_frame.pack(expand=True)
         
         # Button configurations
@@ -56,26 +91,27 @@ class MainWindow:
             {
                 "text": "FCFS\n(First Come First Serve)",
                 "command": lambda: self.open_scheduler("FCFS"),
-                "color": "#89b4fa"
+                "color": COLOR_FCFS
             },
             {
                 "text": "SJF\n(Shortest Job First)",
                 "command": lambda: self.open_scheduler("SJF"),
-                "color": "#a6e3a1"
+                "color": COLOR_SJF
             },
             {
                 "text": "RR\n(Round Robin)",
                 "command": lambda: self.open_scheduler("RR"),
-                "color": "#f9e2af"
+                "color": COLOR_RR
             },
             {
                 "text": "DL\n(Deadlock Prevention)",
                 "command": self.open_deadlock,
-                "color": "#f38ba8"
+                "color": COLOR_DL
             }
         ]
         
-        # Create buttons in a 2x2 grid
+        # Create buttons in a 2x2 grid (kept with their colors so hover can be reset on return)
+        self.menu_buttons = []
         for i, config in enumerate(button_configs):
             row = i // 2
             col = i % 2
@@ -83,11 +119,11 @@ class MainWindow:
             btn = tk.Button(
                 buttons_frame,
                 text=config["text"],
-                font=font.Font(family="Arial", size=16, weight="bold"),
+                font=fonts["button"],
                 bg=config["color"],
-                fg="#1e1e2e",
+                fg=BG_MAIN,
                 activebackground=config["color"],
-                activeforeground="#1e1e2e",
+                activeforeground=BG_MAIN,
                 relief=tk.FLAT,
                 cursor="hand2",
                 padx=30,
@@ -97,6 +133,7 @@ class MainWindow:
                 highlightthickness=0
             )
             btn.grid(row=row, column=col, padx=20, pady=20, sticky="nsew")
+            self.menu_buttons.append((btn, config["color"]))
             
             # Hover effects
             btn.bind("<Enter>", lambda e, b=btn, c=config["color"]: self.on_enter(e, b, c))
@@ -112,9 +149,9 @@ class MainWindow:
         footer_label = tk.Label(
             self.main_frame,
             text="© CPU Scheduling Simulator 2024",
-            font=font.Font(family="Arial", size=10),
-            bg="#1e1e2e",
-            fg="#6c7086"
+            font=fonts["footer"],
+            bg=BG_MAIN,
+            fg=FG_FOOTER
         )
         footer_label.pack(side=tk.BOTTOM, pady=20)
     
@@ -135,19 +172,19 @@ class MainWindow:
     def lighten_color(self, color):
         """Lighten a hex color."""
         # Simple lightening by increasing RGB values
-        color_map = {
-            "#89b4fa": "#a5c9ff",
-            "#a6e3a1": "#b8f0b3",
-            "#f9e2af": "#ffebc4",
-            "#f38ba8": "#ffa0bc"
-        }
-        return color_map.get(color, color)
+        return self.HOVER_COLORS.get(color, color)
+    
+    def clear_screen(self):
+        """Hide the main menu (it is kept for reuse) and destroy any other screen."""
+        self.main_frame.pack_forget()
+        for widget in self.root.winfo_children():
+            if widget is not self.main_frame:
+                widget.destroy()
     
     def open_scheduler(self, algorithm):
         """Open scheduler UI for the selected algorithm."""
         # Clear main window
-        for widget in self.root.winfo_children():
-            widget.destroy()
+        self.clear_screen()
         
         # Create scheduler UI
         scheduler = SchedulerUI(self.root, algorithm, self.show_main_menu)
@@ -156,8 +193,7 @@ class MainWindow:
     def open_deadlock(self):
         """Open deadlock prevention UI."""
         # Clear main window
-        for widget in self.root.winfo_children():
-            widget.destroy()
+        self.clear_screen()
         
         # Create deadlock UI
         deadlock = DeadlockUI(self.root, self.show_main_menu)
@@ -166,11 +202,13 @@ class MainWindow:
     def show_main_menu(self):
         """Return to main menu."""
         # Clear current window
-        for widget in self.root.winfo_children():
-            widget.destroy()
+        self.clear_screen()
         
-        # Recreate main window
-        self.__init__(self.root)
+        # Show the menu built in __init__ again instead of recreating all of its widgets;
+        # buttons may still carry the hover color from the click that left the menu
+        for btn, color in self.menu_buttons:
+            btn.configure(bg=color)
+        self.main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
 
 
 def main():
@@ -14,13 +14,10 @@ Includes:
 """
 
 from typing import List, Dict
-from copy import deepcopy
 import sys
 
 from algorithms import fcfs, sjf, round_robin
 from utils import average_waiting_time, average_turnaround_time, print_gantt_chart
-from advance_features import bankers_algorithm
-from advance_features import total_resources, allocation, max_need, process_ids, resource_names
 
 
 # ---------------------------------------------
@@ -36,18 +33,21 @@ def display_processes(processes: List[Dict]):
     print("-" * 45)
 
 
+# Row template for display_metrics, parsed once and filled from each process dict
+METRICS_ROW = "{pid:<8} {waiting:<15} {turnaround:<18} {response:<15}"
+
+
 def display_metrics(results: List[Dict]):
     """Display metrics for each process and averages."""
-    print(f"{'PID':<8} {'Waiting Time':<15} {'Turnaround Time':<18} {'Response Time':<15}")
-    print("-" * 60)
-    for p in results:
-        print(f"{p['pid']:<8} {p['waiting']:<15} {p['turnaround']:<18} {p['response']:<15}")
-    print("-" * 60)
+    lines = [f"{'PID':<8} {'Waiting Time':<15} {'Turnaround Time':<18} {'Response Time':<15}", "-" * 60]
+    lines.extend(map(METRICS_ROW.format_map, results))
+    lines.append("-" * 60)
     avg_wt = average_waiting_time(results)
     avg_tat = average_turnaround_time(results)
-    print(f"\nAverage Waiting Time   : {avg_wt:.2f}")
-    print(f"Average Turnaround Time: {avg_tat:.2f}")
-    print("-" * 60)
+    lines.append(f"\nAverage Waiting Time   : {avg_wt:.2f}")
+    lines.append(f"Average Turnaround Time: {avg_tat:.2f}")
+    lines.append("-" * 60)
+    sys.stdout.write("\n".join(lines) + "\n")  # one write for the whole table
     return avg_wt, avg_tat  # Return for comparative analysis
 
 
@@ -56,7 +56,7 @@ def run_algorithm(name: str, func, processes: List[Dict], **kwargs):
     print("\n" + "=" * 80)
     print(f"{' ' * 25}{name} RESULTS")
     print("=" * 80 + "\n")
-    proc_copy = deepcopy(processes)
+    proc_copy = [dict(p) for p in processes]  # flat dicts of ints/strs, so per-dict copies are enough
     results, chart = func(proc_copy, **kwargs) if kwargs else func(proc_copy)
     print("GANTT CHART:")
     print_gantt_chart(chart)
@@ -68,6 +68,12 @@ def run_algorithm(name: str, func, processes: List[Dict], **kwargs):
 # ---------------------------------------------
 # COMPARATIVE ANALYSIS FUNCTION
 # ---------------------------------------------
+# Longest comparison bar, so very large averages cannot produce runaway lines
+BAR_CAP = 80
+# Row template for comparative_analysis (name, avg WT, WT bar, avg TAT, TAT bar)
+COMPARISON_ROW = "{:<14} {:<4.2f} {:<12} {:<4.2f} {}\n"
+
+
 def comparative_analysis(all_results: List[Dict]):
     """Display side-by-side comparison of all three algorithms."""
     print("\n" + "=" * 80)
@@ -77,9 +83,9 @@ def comparative_analysis(all_results: List[Dict]):
     print("-" * 45)
 
     for alg in all_results:
-        bar_wt = "█" * int(round(alg['avg_wt'] ))
-        bar_tat = "█" * int(round(alg['avg_tat'] ))
-        print(f"{alg['name']:<14} {alg['avg_wt']:<4.2f} {bar_wt:<12} {alg['avg_tat']:<4.2f} {bar_tat}\n")
+        bar_wt = "█" * min(BAR_CAP, int(round(alg['avg_wt'])))
+        bar_tat = "█" * min(BAR_CAP, int(round(alg['avg_tat'])))
+        print(COMPARISON_ROW.format(alg['name'], alg['avg_wt'], bar_wt, alg['avg_tat'], bar_tat))
     print("-" * 40)
 
     # Highlight best metrics
@@ -183,6 +189,9 @@ def main():
 
         elif choice == 5:
             print("\nRunning Deadlock Prevention (Banker's Algorithm)...\n")
+            # Imported on demand: scheduling-only sessions never load the deadlock package
+            from advance_features import bankers_algorithm
+            from advance_features import total_resources, allocation, max_need, process_ids, resource_names
             bankers_algorithm(
             total_resources=total_resources,
             allocation=allocation,
@@ -9,6 +9,7 @@ Functions:
     - get_execution_order: Get execution order string from chart.
 """
 
+import sys
 from typing import List, Tuple, Optional
 
 
@@ -45,44 +46,40 @@ def print_gantt_chart(
         print("No processes to display.")
         return
 
+    # All output is collected in lines and written to stdout once at the end
+    lines = []
+
     # ---------- Execution Order Text ----------
     if show_execution_order:
         execution_order = get_execution_order(chart)
         if execution_order:
-            print(f"Execution Order: {execution_order}\n")
+            lines.append(f"Execution Order: {execution_order}\n")
 
     # ---------- Create timeline bars ----------
-    timeline = "|"
+    # (fragments are joined once instead of growing the strings with += per segment)
+    timeline = "|" + "".join([f" {pid:^8} |" for pid, _, _ in chart])
     if show_start_times:
         # Format with both start and finish times (like FCFS)
-        time_labels = "0"
-        for pid, start, end in chart:
-            timeline += f" {pid:^8} |"
-            time_labels += f"{start:>10}{end:>10}"
+        time_labels = "0" + "".join([f"{start:>10}{end:>10}" for _, start, end in chart])
     else:
         # Format with only finish times (like SJF/RR)
-        time_labels = "0"
-        for pid, start, end in chart:
-            timeline += f" {pid:^8} |"
-            time_labels += f"{'':>8}{end:>3}"
+        time_labels = "0" + "".join([f"{'':>8}{end:>3}" for _, _, end in chart])
 
     # Print header if provided, otherwise use default
-    if header:
-        print(header)
-    else:
-        print("Gantt Chart Timeline:")
-    
-    print(timeline)
-    print(time_labels)
+    lines.append(header if header else "Gantt Chart Timeline:")
+    lines.append(timeline)
+    lines.append(time_labels)
 
     # ---------- Visual block representation ----------
     if show_visual:
-        print("\nVisual Timeline:")
+        lines.append("\nVisual Timeline:")
         for pid, start, end in chart:
             duration = end - start
             # Use a block character for visual representation
             bar = "█" * max(1, duration)
-            print(f"  {pid}: {' ' * start}{bar} ({start} → {end})")
+            lines.append(f"  {pid}: {' ' * start}{bar} ({start} → {end})")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 # -----------------------
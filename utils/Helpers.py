@@ -1,25 +1,26 @@
+from operator import itemgetter
 from typing import List, Dict
 
 def average_waiting_time(processes: List[Dict]) -> float:#calculates average waiting time of processes for all three algorithms, it's acting like helper for gantt.
     if not processes:
         return 0.0
-    total_waiting = sum(p['waiting'] for p in processes)
+    total_waiting = sum(map(itemgetter('waiting'), processes))#map + itemgetter sums the column without a generator frame
     return total_waiting / len(processes)
 
 
 def average_turnaround_time(processes: List[Dict]) -> float:
     if not processes:
         return 0.0
-    total_turnaround = sum(p['turnaround'] for p in processes)
+    total_turnaround = sum(map(itemgetter('turnaround'), processes))
     return total_turnaround / len(processes)
 
 
 def sort_processes_by_arrival(processes: List[Dict]) -> List[Dict]:
-     return sorted(processes, key=lambda x: x['arrival'])
+    return sorted(processes, key=itemgetter('arrival'))#itemgetter reads the key in C, no Python call per process
 
 
 def sort_processes_by_burst(processes: List[Dict]) -> List[Dict]:
-    return sorted(processes, key=lambda x: x['burst'])
+    return sorted(processes, key=itemgetter('burst'))
 
 
 